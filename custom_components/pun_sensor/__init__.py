@@ -22,9 +22,14 @@ from .const import (
 from .coordinator import PUNDataUpdateCoordinator
 from .interfaces import DEFAULT_ZONA, Zona
 
-if AwesomeVersion(HA_VERSION) >= AwesomeVersion("2024.5.0"):
+# Verifica una sola volta il supporto alle fasi di setup (HA 2024.5.0)
+_HAS_SETUP_PHASES: bool = AwesomeVersion(HA_VERSION) >= AwesomeVersion("2024.5.0")
+if _HAS_SETUP_PHASES:
     from homeassistant.setup import SetupPhases, async_pause_setup
 
+# Verifica il supporto alla versione delle configurazioni (HA 2024.3.0)
+_HAS_ENTRY_VERSION: bool = AwesomeVersion(HA_VERSION) >= AwesomeVersion("2024.3.0")
+
 # Ottiene il logger
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,7 +41,7 @@ async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
     """Impostazione dell'integrazione da configurazione Home Assistant."""
 
     # Carica le dipendenze di holidays in background per evitare errori nel log
-    if AwesomeVersion(HA_VERSION) >= AwesomeVersion("2024.5.0"):
+    if _HAS_SETUP_PHASES:
         with async_pause_setup(hass, SetupPhases.WAIT_IMPORT_PACKAGES):
             await hass.async_add_import_executor_job(country_holidays, "IT")
 
@@ -192,7 +197,7 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         new_data = {**config_entry.data}
         new_data[CONF_ZONA] = DEFAULT_ZONA.name
 
-        if AwesomeVersion(HA_VERSION) >= AwesomeVersion("2024.3.0"):
+        if _HAS_ENTRY_VERSION:
             hass.config_entries.async_update_entry(
                 config_entry, data=new_data, version=2
             )
@@ -31,13 +31,18 @@ selector_config = selector.SelectSelectorConfig(
 if AwesomeVersion(HA_VERSION) >= AwesomeVersion("2023.9.0"):
     selector_config["sort"] = True
 
+# Le release precedenti ad HA 2024.12.0 richiedono di impostare config_entry
+_SET_OPTIONS_CONFIG_ENTRY: bool = AwesomeVersion(HA_VERSION) < AwesomeVersion(
+    "2024.12.0b0"
+)
+
 
 class PUNOptionsFlow(config_entries.OptionsFlow):
     """Opzioni per prezzi PUN (= riconfigurazione successiva)."""
 
     def __init__(self, entry: config_entries.ConfigEntry) -> None:
         """Inizializzazione opzioni."""
-        if AwesomeVersion(HA_VERSION) < AwesomeVersion("2024.12.0b0"):
+        if _SET_OPTIONS_CONFIG_ENTRY:
             self.config_entry = entry
 
     async def async_step_init(self, user_input=None) -> ConfigFlowResult | dict:  # pyright: ignore[reportInvalidTypeForm]
@@ -50,6 +50,32 @@ from .utils import (
 # Ottiene il logger
 _LOGGER = logging.getLogger(__name__)
 
+# Unità di misura dei prezzi (costante per tutti i sensori)
+_UNIT = f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
+
+# Icona dei sensori PUN variabili (dipende dalla versione di Home Assistant)
+if AwesomeVersion(HA_VERSION) < AwesomeVersion("2024.1.0"):
+    _ICON_PUN_VARIABILE = "mdi:receipt-clock-outline"
+else:
+    _ICON_PUN_VARIABILE = "mdi:invoice-clock-outline"
+
+# Possibili stati del sensore della fascia corrente
+_FASCIA_OPTIONS: list[str] = [Fascia.F1.value, Fascia.F2.value, Fascia.F3.value]
+
+# Nomi del sensore del prezzo della fascia corrente
+_PREZZO_FASCIA_NAMES: dict[Fascia, str] = {
+    fascia: f"Prezzo fascia corrente ({fascia.value})" for fascia in Fascia
+}
+
+# ID dei sensori PUN per ciascuna fascia
+_FASCIA_ENTITY_IDS: dict[Fascia, str] = {
+    Fascia.MONO: ENTITY_ID_FORMAT.format("pun_mono_orario"),
+    Fascia.F1: ENTITY_ID_FORMAT.format("pun_fascia_f1"),
+    Fascia.F2: ENTITY_ID_FORMAT.format("pun_fascia_f2"),
+    Fascia.F3: ENTITY_ID_FORMAT.format("pun_fascia_f3"),
+    Fascia.F23: ENTITY_ID_FORMAT.format("pun_fascia_f23"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -63,51 +89,52 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config.entry_id]
 
     # Crea i sensori dei valori del pun (legati al coordinator)
-    entities: list[SensorEntity] = []
-    entities.extend(
-        PUNSensorEntity(coordinator, fascia) for fascia in PunValues().value
-    )
-
-    # Crea sensori aggiuntivi
-    entities.append(FasciaPUNSensorEntity(coordinator))
-    entities.append(PrezzoFasciaPUNSensorEntity(coordinator))
-    entities.append(PrezzoZonaleSensorEntity(coordinator))
-    entities.append(PrezzoZonale15MinSensorEntity(coordinator))
-    entities.append(PUNOrarioSensorEntity(coordinator))
-    entities.append(PUN15MinSensorEntity(coordinator))
+    # e i sensori aggiuntivi
+    entities: list[SensorEntity] = [
+        *(PUNSensorEntity(coordinator, fascia) for fascia in PunValues.value),
+        FasciaPUNSensorEntity(coordinator),
+        PrezzoFasciaPUNSensorEntity(coordinator),
+        PrezzoZonaleSensorEntity(coordinator),
+        PrezzoZonale15MinSensorEntity(coordinator),
+        PUNOrarioSensorEntity(coordinator),
+        PUN15MinSensorEntity(coordinator),
+    ]
 
     # Aggiunge i sensori ma non aggiorna automaticamente via web
     # per lasciare il tempo ad Home Assistant di avviarsi
     async_add_entities(entities, update_before_add=False)
 
 
-class PUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
+class PUNSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
     """Sensore PUN relativo al prezzo medio mensile per fasce."""
 
+    # Icona da usare nel frontend
+    _attr_icon = "mdi:chart-line"
+
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
+
     def __init__(self, coordinator: PUNDataUpdateCoordinator, fascia: Fascia) -> None:
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator e tipo
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
+        # Inizializza il tipo
         self.fascia: Fascia = fascia
 
         # ID univoco sensore basato su un nome fisso
-        match self.fascia:
-            case Fascia.MONO:
-                self.entity_id = ENTITY_ID_FORMAT.format("pun_mono_orario")
-            case Fascia.F1:
-                self.entity_id = ENTITY_ID_FORMAT.format("pun_fascia_f1")
-            case Fascia.F2:
-                self.entity_id = ENTITY_ID_FORMAT.format("pun_fascia_f2")
-            case Fascia.F3:
-                self.entity_id = ENTITY_ID_FORMAT.format("pun_fascia_f3")
-            case Fascia.F23:
-                self.entity_id = ENTITY_ID_FORMAT.format("pun_fascia_f23")
-            case _:
-                self.entity_id = None
+        self.entity_id = _FASCIA_ENTITY_IDS.get(self.fascia)
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
+
+        # Nome del sensore (fisso per ciascuna fascia)
+        if self.fascia == Fascia.MONO:
+            self._attr_name = "PUN mono-orario"
+        else:
+            self._attr_name = f"PUN fascia {self.fascia.value}"
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -115,6 +142,9 @@ class PUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         self._available: bool = False
         self._native_value: float = 0
 
+        # Ultimo stato scritto in Home Assistant
+        self._last_state: tuple | None = None
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -128,29 +158,34 @@ class PUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         if coordinator_event != EVENT_UPDATE_PUN:
             return
 
+        pun = self.coordinator.pun_data.pun
+        values = self.coordinator.pun_values.value
         if self.fascia != Fascia.F23:
             # Tutte le fasce tranne F23
-            if len(self.coordinator.pun_data.pun[self.fascia]) > 0:
+            if pun[self.fascia]:
                 # Ci sono dati, sensore disponibile
                 self._available = True
-                self._native_value = self.coordinator.pun_values.value[self.fascia]
+                self._native_value = values[self.fascia]
             else:
                 # Non ci sono dati, sensore non disponibile
                 self._available = False
 
-        elif (
-            len(self.coordinator.pun_data.pun[Fascia.F2])
-            and len(self.coordinator.pun_data.pun[Fascia.F3])
-        ) > 0:
+        elif pun[Fascia.F2] and pun[Fascia.F3]:
             # Caso speciale per fascia F23: affinché sia disponibile devono
             # esserci dati sia sulla fascia F2 che sulla F3,
             # visto che è calcolata a partire da questi
             self._available = True
-            self._native_value = self.coordinator.pun_values.value[self.fascia]
+            self._native_value = values[self.fascia]
         else:
             # Non ci sono dati, sensore non disponibile
             self._available = False
 
+        # Evita di scrivere lo stato se non è cambiato nulla
+        current_state = (self._available, self._native_value)
+        if current_state == self._last_state:
+            return
+        self._last_state = current_state
+
         # Aggiorna lo stato di Home Assistant
         self.async_write_ha_state()
 
@@ -167,15 +202,13 @@ class PUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
 
         # Recupera lo stato precedente, se esiste
         if (old_data := await self.async_get_last_extra_data()) is not None:
-            if (old_native_value := old_data.as_dict().get("native_value")) is not None:
+            # Recupera il dizionario con i valori precedenti
+            old_data_dict = old_data.as_dict()
+
+            if (old_native_value := old_data_dict.get("native_value")) is not None:
                 self._available = True
                 self._native_value = old_native_value
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -186,28 +219,22 @@ class PUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Valore corrente del sensore."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
 
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        return "mdi:chart-line"
+class FasciaPUNSensorEntity(CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity):
+    """Sensore che rappresenta il nome la fascia oraria PUN corrente."""
 
-    @property
-    def name(self) -> str | None:
-        """Restituisce il nome del sensore."""
-        if self.fascia == Fascia.MONO:
-            return "PUN mono-orario"
-        if self.fascia:
-            return f"PUN fascia {self.fascia.value}"
-        return None
+    # Icona da usare nel frontend
+    _attr_icon = "mdi:timeline-clock-outline"
 
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
 
-class FasciaPUNSensorEntity(CoordinatorEntity, SensorEntity):
-    """Sensore che rappresenta il nome la fascia oraria PUN corrente."""
+    # Nome del sensore
+    _attr_name = "Fascia corrente"
+
+    # Classe del sensore e possibili stati
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = _FASCIA_OPTIONS
 
     # Non memorizza gli attributi nel recoder
     _unrecorded_attributes = frozenset({MATCH_ALL})
@@ -216,13 +243,12 @@ class FasciaPUNSensorEntity(CoordinatorEntity, SensorEntity):
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_fascia_corrente")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
+
+        # Disponibilità in base alla fascia corrente
+        self._available: bool = coordinator.fascia_corrente is not None
 
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
@@ -237,27 +263,15 @@ class FasciaPUNSensorEntity(CoordinatorEntity, SensorEntity):
         if coordinator_event != EVENT_UPDATE_FASCIA:
             return
 
-        self.async_write_ha_state()
+        # Il sensore è disponibile se la fascia corrente è nota
+        self._available = self.coordinator.fascia_corrente is not None
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
-        return self.coordinator.fascia_corrente is not None
-
-    @property
-    def device_class(self) -> SensorDeviceClass | None:
-        """Classe del sensore."""
-        return SensorDeviceClass.ENUM
-
-    @property
-    def options(self) -> list[str] | None:
-        """Possibili stati del sensore."""
-        return [Fascia.F1.value, Fascia.F2.value, Fascia.F3.value]
+        return self._available
 
     @property
     def native_value(self) -> str | None:
@@ -277,31 +291,28 @@ class FasciaPUNSensorEntity(CoordinatorEntity, SensorEntity):
             "termine_fascia_successiva": self.coordinator.termine_prossima_fascia,
         }
 
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        return "mdi:timeline-clock-outline"
 
-    @property
-    def name(self) -> str:
-        """Restituisce il nome del sensore."""
-        return "Fascia corrente"
+class PrezzoFasciaPUNSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
+    """Sensore che rappresenta il prezzo PUN della fascia corrente."""
 
+    # Icona da usare nel frontend
+    _attr_icon = "mdi:currency-eur"
 
-class PrezzoFasciaPUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
-    """Sensore che rappresenta il prezzo PUN della fascia corrente."""
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
 
     def __init__(self, coordinator: PUNDataUpdateCoordinator) -> None:
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_prezzo_fascia_corrente")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -310,6 +321,9 @@ class PrezzoFasciaPUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity
         self._native_value: float = 0
         self._friendly_name: str = "Prezzo fascia corrente"
 
+        # Ultimo stato scritto in Home Assistant
+        self._last_state: tuple | None = None
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -323,20 +337,21 @@ class PrezzoFasciaPUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity
         if coordinator_event not in (EVENT_UPDATE_PUN, EVENT_UPDATE_FASCIA):
             return
 
-        if self.coordinator.fascia_corrente is not None:
-            self._available = (
-                len(self.coordinator.pun_data.pun[self.coordinator.fascia_corrente]) > 0
-            )
-            self._native_value = self.coordinator.pun_values.value[
-                self.coordinator.fascia_corrente
-            ]
-            self._friendly_name = (
-                f"Prezzo fascia corrente ({self.coordinator.fascia_corrente.value})"
-            )
+        if (fascia_corrente := self.coordinator.fascia_corrente) is not None:
+            self._available = bool(self.coordinator.pun_data.pun[fascia_corrente])
+            self._native_value = self.coordinator.pun_values.value[fascia_corrente]
+            self._friendly_name = _PREZZO_FASCIA_NAMES[fascia_corrente]
         else:
             self._available = False
             self._native_value = 0
             self._friendly_name = "Prezzo fascia corrente"
+
+        # Evita di scrivere lo stato se non è cambiato nulla
+        current_state = (self._available, self._native_value, self._friendly_name)
+        if current_state == self._last_state:
+            return
+        self._last_state = current_state
+
         self.async_write_ha_state()
 
     @property
@@ -355,19 +370,15 @@ class PrezzoFasciaPUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity
 
         # Recupera lo stato precedente, se esiste
         if (old_data := await self.async_get_last_extra_data()) is not None:
-            if (old_native_value := old_data.as_dict().get("native_value")) is not None:
+            # Recupera il dizionario con i valori precedenti
+            old_data_dict = old_data.as_dict()
+
+            if (old_native_value := old_data_dict.get("native_value")) is not None:
                 self._available = True
                 self._native_value = old_native_value
-            if (
-                old_friendly_name := old_data.as_dict().get("friendly_name")
-            ) is not None:
+            if (old_friendly_name := old_data_dict.get("friendly_name")) is not None:
                 self._friendly_name = old_friendly_name
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -378,25 +389,26 @@ class PrezzoFasciaPUNSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity
         """Restituisce il prezzo della fascia corrente."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
-
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        return "mdi:currency-eur"
-
     @property
     def name(self) -> str:
         """Restituisce il nome del sensore."""
         return self._friendly_name
 
 
-class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
+class PrezzoZonaleSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
     """Sensore del prezzo zonale aggiornato ogni ora."""
 
+    # Icona da usare nel frontend
+    _attr_icon = "mdi:map-clock-outline"
+
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
+
     # Non memorizza gli attributi nel recoder
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
@@ -404,13 +416,9 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator e tipo
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_prezzo_zonale")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -420,6 +428,9 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         self._friendly_name: str = "Prezzo zonale"
         self._prezzi_zonali: dict[str, float | None] = {}
 
+        # Inizializza gli attributi di stato
+        self._update_attributes()
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -445,6 +456,7 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                 self._friendly_name = "Prezzo zonale"
                 self._prezzi_zonali = {}
                 self._available = False
+                self._update_attributes()
                 self.async_write_ha_state()
                 return
 
@@ -476,6 +488,9 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                 # Nessuna zona impostata
                 self._available = False
 
+            # Aggiorna gli attributi con i prezzi
+            self._update_attributes()
+
         # Aggiorna lo stato di Home Assistant
         self.async_write_ha_state()
 
@@ -532,6 +547,7 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
             # Valori delle fasce orarie
             if (old_prezzi_zonali := old_data_dict.get("prezzi_zonali")) is not None:
                 self._prezzi_zonali = old_prezzi_zonali
+                self._update_attributes()
 
                 # Controlla se il prezzo orario esiste per l'ora corrente
                 if str(self.coordinator.orario_prezzo) in self._prezzi_zonali:
@@ -550,11 +566,6 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                     # Imposta come non disponibile
                     self._available = False
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -565,24 +576,13 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Valore corrente del sensore."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
-
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        return "mdi:map-clock-outline"
-
     @property
     def name(self) -> str | None:
         """Restituisce il nome del sensore."""
         return self._friendly_name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Restituisce gli attributi di stato."""
+    def _update_attributes(self) -> None:
+        """Aggiorna gli attributi di stato con i prezzi di oggi e domani."""
 
         # Crea il dizionario degli attributi
         attributes: dict[str, Any] = {}
@@ -610,13 +610,24 @@ class PrezzoZonaleSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                     str(data_ora_prezzo)
                 )
 
-        # Restituisce gli attributi
-        return attributes
+        # Memorizza gli attributi, restituiti ad ogni scrittura dello stato
+        self._attr_extra_state_attributes = attributes
 
 
-class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
+class PrezzoZonale15MinSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
     """Sensore del prezzo zonale aggiornato ogni 15 minuti."""
 
+    # Icona da usare nel frontend
+    _attr_icon = "mdi:map-clock-outline"
+
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
+
     # Non memorizza gli attributi nel recoder
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
@@ -624,13 +635,9 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator e tipo
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_prezzo_zonale_15min")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -640,6 +647,9 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
         self._friendly_name: str = "Prezzo zonale 15 min"
         self._prezzi_zonali_15min: dict[str, float | None] = {}
 
+        # Inizializza gli attributi di stato
+        self._update_attributes()
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -667,6 +677,7 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
                 self._friendly_name = "Prezzo zonale 15 min"
                 self._prezzi_zonali_15min = {}
                 self._available = False
+                self._update_attributes()
                 self.async_write_ha_state()
                 return
 
@@ -701,6 +712,9 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
                 # Nessuna zona impostata
                 self._available = False
 
+            # Aggiorna gli attributi con i prezzi
+            self._update_attributes()
+
         # Aggiorna lo stato di Home Assistant
         self.async_write_ha_state()
 
@@ -759,6 +773,7 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
                 old_prezzi_zonali_15min := old_data_dict.get("prezzi_zonali_15min")
             ) is not None:
                 self._prezzi_zonali_15min = old_prezzi_zonali_15min
+                self._update_attributes()
 
                 # Controlla se il prezzo a 15 minuti esiste per il periodo corrente
                 if (
@@ -780,11 +795,6 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
                     # Imposta come non disponibile
                     self._available = False
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -795,24 +805,13 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
         """Valore corrente del sensore."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
-
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        return "mdi:map-clock-outline"
-
     @property
     def name(self) -> str | None:
         """Restituisce il nome del sensore."""
         return self._friendly_name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Restituisce gli attributi di stato."""
+    def _update_attributes(self) -> None:
+        """Aggiorna gli attributi di stato con i prezzi di oggi e domani."""
 
         # Crea il dizionario degli attributi
         attributes: dict[str, Any] = {}
@@ -842,13 +841,24 @@ class PrezzoZonale15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEnti
                     str(data_ora_prezzo)
                 )
 
-        # Restituisce gli attributi
-        return attributes
+        # Memorizza gli attributi, restituiti ad ogni scrittura dello stato
+        self._attr_extra_state_attributes = attributes
 
 
-class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
+class PUNOrarioSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
     """Sensore del prezzo PUN aggiornato ogni ora."""
 
+    # Icona da usare nel frontend
+    _attr_icon = _ICON_PUN_VARIABILE
+
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
+
     # Non memorizza gli attributi nel recoder
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
@@ -856,13 +866,9 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator e tipo
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_orario")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -872,6 +878,9 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         self._friendly_name: str = "PUN orario"
         self._pun_orari: dict[str, float | None] = {}
 
+        # Inizializza gli attributi di stato
+        self._update_attributes()
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -910,6 +919,9 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                 # Orario non disponibile
                 self._available = False
 
+            # Aggiorna gli attributi con i prezzi
+            self._update_attributes()
+
         # Aggiorna lo stato di Home Assistant
         self.async_write_ha_state()
 
@@ -936,6 +948,7 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
             # Valori dei prezzi orari
             if (old_pun_orari := old_data_dict.get("pun_orari")) is not None:
                 self._pun_orari = old_pun_orari
+                self._update_attributes()
 
                 # Controlla se il prezzo orario esiste per l'ora corrente
                 if str(self.coordinator.orario_prezzo) in self._pun_orari:
@@ -952,11 +965,6 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                     # Imposta come non disponibile
                     self._available = False
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -967,26 +975,13 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Valore corrente del sensore."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
-
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        if AwesomeVersion(HA_VERSION) < AwesomeVersion("2024.1.0"):
-            return "mdi:receipt-clock-outline"
-        return "mdi:invoice-clock-outline"
-
     @property
     def name(self) -> str | None:
         """Restituisce il nome del sensore."""
         return self._friendly_name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Restituisce gli attributi di stato."""
+    def _update_attributes(self) -> None:
+        """Aggiorna gli attributi di stato con i prezzi di oggi e domani."""
 
         # Crea il dizionario degli attributi
         attributes: dict[str, Any] = {}
@@ -1007,13 +1002,24 @@ class PUNOrarioSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
             data_ora_prezzo = get_datetime_from_ordinal_hour(domani, (1 + h))
             attributes[str(data_ora_prezzo)] = self._pun_orari.get(str(data_ora_prezzo))
 
-        # Restituisce gli attributi
-        return attributes
+        # Memorizza gli attributi, restituiti ad ogni scrittura dello stato
+        self._attr_extra_state_attributes = attributes
 
 
-class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
+class PUN15MinSensorEntity(
+    CoordinatorEntity[PUNDataUpdateCoordinator], SensorEntity, RestoreEntity
+):
     """Sensore del prezzo PUN aggiornato ogni 15 minuti."""
 
+    # Icona da usare nel frontend
+    _attr_icon = _ICON_PUN_VARIABILE
+
+    # Usa il nome dell'entità
+    _attr_has_entity_name = True
+
+    # Unità di misura
+    _attr_native_unit_of_measurement = _UNIT
+
     # Non memorizza gli attributi nel recoder
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
@@ -1021,13 +1027,9 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Inizializza il sensore."""
         super().__init__(coordinator)
 
-        # Inizializza coordinator e tipo
-        self.coordinator: PUNDataUpdateCoordinator = coordinator
-
         # ID univoco sensore basato su un nome fisso
         self.entity_id = ENTITY_ID_FORMAT.format("pun_15min")
         self._attr_unique_id = self.entity_id
-        self._attr_has_entity_name = True
 
         # Inizializza le proprietà comuni
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -1037,6 +1039,9 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         self._friendly_name: str = "PUN 15 min"
         self._pun_15min: dict[str, float | None] = {}
 
+        # Inizializza gli attributi di stato
+        self._update_attributes()
+
     def _handle_coordinator_update(self) -> None:
         """Gestisce l'aggiornamento dei dati dal coordinator."""
 
@@ -1075,6 +1080,9 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                 # Orario non disponibile
                 self._available = False
 
+            # Aggiorna gli attributi con i prezzi
+            self._update_attributes()
+
         # Aggiorna lo stato di Home Assistant
         self.async_write_ha_state()
 
@@ -1101,6 +1109,7 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
             # Valori dei prezzi a 15 minuti
             if (old_pun_15min := old_data_dict.get("pun_15min")) is not None:
                 self._pun_15min = old_pun_15min
+                self._update_attributes()
 
                 # Controlla se il prezzo a 15 minuti esiste per il periodo corrente
                 if str(self.coordinator.orario_prezzo_15min) in self._pun_15min:
@@ -1119,11 +1128,6 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
                     # Imposta come non disponibile
                     self._available = False
 
-    @property
-    def should_poll(self) -> bool:
-        """Determina l'aggiornamento automatico."""
-        return False
-
     @property
     def available(self) -> bool:
         """Determina se il valore è disponibile."""
@@ -1134,26 +1138,13 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
         """Valore corrente del sensore."""
         return self._native_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Unita' di misura."""
-        return f"{CURRENCY_EURO}/{UnitOfEnergy.KILO_WATT_HOUR}"
-
-    @property
-    def icon(self) -> str:
-        """Icona da usare nel frontend."""
-        if AwesomeVersion(HA_VERSION) < AwesomeVersion("2024.1.0"):
-            return "mdi:receipt-clock-outline"
-        return "mdi:invoice-clock-outline"
-
     @property
     def name(self) -> str | None:
         """Restituisce il nome del sensore."""
         return self._friendly_name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Restituisce gli attributi di stato."""
+    def _update_attributes(self) -> None:
+        """Aggiorna gli attributi di stato con i prezzi di oggi e domani."""
 
         # Crea il dizionario degli attributi
         attributes: dict[str, Any] = {}
@@ -1176,5 +1167,5 @@ class PUN15MinSensorEntity(CoordinatorEntity, SensorEntity, RestoreEntity):
             data_ora_prezzo = get_datetime_from_periodo_15min(domani, (1 + p))
             attributes[str(data_ora_prezzo)] = self._pun_15min.get(str(data_ora_prezzo))
 
-        # Restituisce gli attributi
-        return attributes
+        # Memorizza gli attributi, restituiti ad ogni scrittura dello stato
+        self._attr_extra_state_attributes = attributes